@@ -2,7 +2,10 @@
 
 from typing import List, Tuple, Dict
 
+from .parse_cache import disk_cached
 
+
+@disk_cached(version=1)
 def parse_design_file(file_path: str) -> Dict[str, List[Tuple[str, str]]]:
     """
     Parse a design file to extract MCS sites and markers.
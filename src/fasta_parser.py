@@ -1,46 +1,156 @@
 """FASTA file parser for reading genomic DNA sequences."""
 
-from typing import List, Tuple
+from functools import lru_cache
+import mmap
+import os
+from typing import List, Tuple, Union
+
+import numpy as np
+
+# Translate table that uppercases ASCII in one C-level pass; whitespace is
+# dropped via the delete argument of bytes.translate.
+_UPPER = bytes.maketrans(bytes(range(ord('a'), ord('z') + 1)),
+                         bytes(range(ord('A'), ord('Z') + 1)))
+_WHITESPACE = b'\r\n\t '
 
 
 def read_fasta(file_path: str) -> Tuple[str, str]:
     """
     Read a FASTA file and return the header and sequence.
-    
+
+    Parses are memoized per (path, mtime), so pipeline stages and tests
+    that re-read an unchanged file skip the disk entirely; edits
+    invalidate the entry automatically.
+
     Args:
         file_path: Path to the FASTA file
-        
+
     Returns:
         Tuple of (header, sequence) where sequence is uppercase and without whitespace
     """
+    # Headers are free text and may carry non-ASCII (descriptions, units);
+    # only the sequence body is required to be ASCII.
+    path = os.path.abspath(file_path)
+    return _read_fasta_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _read_fasta_cached(file_path: str, mtime_ns: int) -> Tuple[str, str]:
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return "", ""
+
+        with mm:
+            # Fast path for single-record files: the header scan touches only
+            # the mapped pages it needs, and one translate call uppercases
+            # and strips whitespace from the whole body in a single pass.
+            if mm[:1] == b'>':
+                nl = mm.find(b'\n')
+                if nl == -1:
+                    return mm[1:].decode('utf-8').strip(), ""
+                header = mm[1:nl].decode('utf-8').strip()
+                if mm.find(b'>', nl + 1) == -1:
+                    sequence = mm[nl + 1:].translate(
+                        _UPPER, delete=_WHITESPACE).decode('ascii')
+                    return header, sequence
+
+            # Multi-record (or headerless) file: materialize once for the
+            # line loop below.
+            data = mm[:]
+
+    # Multi-record (or headerless) file: fall back to the line loop, staying
+    # in bytes so uppercasing is the same table pass as the fast path instead
+    # of per-line Unicode-aware str.upper().
     header = ""
     sequence = []
-    
-    with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith('>'):
-                header = line[1:]  # Remove '>' prefix
-            else:
-                sequence.append(line.upper())
-    
-    full_sequence = ''.join(sequence)
-    return header, full_sequence
-
-
-def write_fasta(file_path: str, header: str, sequence: str, line_length: int = 60):
+    for line in data.split(b'\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(b'>'):
+            header = line[1:].decode('utf-8')  # Remove '>' prefix
+        else:
+            sequence.append(line.translate(_UPPER))
+
+    return header, b''.join(sequence).decode('ascii')
+
+
+def read_fasta_mmap(file_path: str) -> Tuple[str, np.ndarray]:
+    """
+    Memory-map a single-record FASTA file and return the sequence as bytes.
+
+    The OS page cache backs the sequence data, so multi-GB genomes are not
+    copied into a Python string; downstream scanners operate on the uint8
+    view directly.
+
+    Args:
+        file_path: Path to the FASTA file
+
+    Returns:
+        Tuple of (header, sequence) where sequence is a numpy uint8 array
+    """
+    with open(file_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mm[:1] != b'>':
+        raise ValueError(f"Not a FASTA file (missing '>' header): {file_path}")
+
+    nl = mm.find(b'\n')
+    if nl == -1:
+        return mm[1:].decode('utf-8').strip(), np.empty(0, dtype=np.uint8)
+
+    header = mm[1:nl].decode('utf-8').strip()
+    arr = np.frombuffer(mm, dtype=np.uint8, offset=nl + 1)
+
+    # Zero-copy when the body is a single line; otherwise one vectorized
+    # compaction to drop line breaks and stray whitespace.
+    ws = (arr == ord('\n')) | (arr == ord('\r')) | (arr == ord('\t')) | (arr == ord(' '))
+    if ws.any():
+        arr = arr[~ws]
+
+    return header, arr
+
+
+def write_fasta(file_path: str, header: str, sequence: 'Union[str, bytes]',
+                line_length: int = 60):
     """
     Write a sequence to a FASTA file.
-    
+
     Args:
         file_path: Path to output FASTA file
         header: Sequence header (without '>')
-        sequence: DNA sequence
+        sequence: DNA sequence (str or ASCII bytes)
         line_length: Characters per line (default 60)
     """
-    with open(file_path, 'w') as f:
-        f.write(f">{header}\n")
-        for i in range(0, len(sequence), line_length):
-            f.write(sequence[i:i+line_length] + "\n")
+    body = sequence.encode('ascii') if isinstance(sequence, str) else bytes(sequence)
+    out = bytearray()
+    # Header text may be non-ASCII (it round-trips from read_fasta, which
+    # decodes UTF-8); only the sequence body is ASCII-constrained.
+    out += b'>' + header.encode('utf-8') + b'\n'
+
+    # Lay out all full lines as a (lines, line_length + 1) block with the
+    # newline column filled in, so wrapping needs no per-line Python loop.
+    n_full = len(body) // line_length
+    if n_full:
+        block = np.empty((n_full, line_length + 1), dtype=np.uint8)
+        block[:, :line_length] = np.frombuffer(
+            body, dtype=np.uint8, count=n_full * line_length).reshape(n_full, line_length)
+        block[:, line_length] = ord('\n')
+        out += block.tobytes()
+
+    tail = body[n_full * line_length:]
+    if tail:
+        out += tail + b'\n'
+
+    # The record is fully formatted, so write it straight through the fd:
+    # one syscall, no buffered-IO layer. The loop only matters for partial
+    # writes on very large records.
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(out)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -1,92 +1,194 @@
 """Parser and database for markers from markers.tab file."""
 
-from typing import Dict, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+import os
 import re
 
+from .parse_cache import disk_cached
 
-def parse_markers_tab(file_path: str) -> Dict[str, Dict[str, str]]:
+
+@dataclass(slots=True, frozen=True)
+class MarkerRow:
+    """One parsed row of markers.tab, with dict-style access for compat."""
+    category: str
+    name: str
+    recognition: str
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, key, default)
+
+
+# Compiled once: extracts the recognition sequence from strings like
+# "Recognizes GAATTC, 5′ overhangs".
+_SITE_RE = re.compile(r'([ATCG]{4,})')
+
+# Fallback: known restriction sites for enzymes missing from the tab file.
+_KNOWN_SITES = {
+    'ECORI': 'GAATTC',
+    'BAMHI': 'GGATCC',
+    'HINDIII': 'AAGCTT',
+    'PSTI': 'CTGCAG',
+    'KPRI': 'GGTACC',
+    'SACI': 'GAGCTC',
+    'SALI': 'GTCGAC',
+    'XBAI': 'TCTAGA',
+    'NOTI': 'GCGGCCGC',
+    'SMAI': 'CCCGGG',
+    'SPHI': 'GCATGC'
+}
+
+
+def _canonical_category(category: str) -> str:
+    """Canonicalize a category label for index lookups."""
+    # All restriction enzyme variants ("Restriction enzyme (Type IIS)" etc.)
+    # collapse into one bucket, matching the old substring filter.
+    if 'Restriction enzyme' in category:
+        return 'restriction_enzyme'
+    return category.lower().replace(' ', '_')
+
+
+class MarkersDB(dict):
+    """
+    Parsed markers table with precomputed lookup indexes.
+
+    Behaves as the plain name->row dict returned previously, but carries an
+    uppercase name index, a recognition-site cache, and a category index so
+    enzyme lookups and category filters are O(1) instead of a linear scan
+    plus a regex compile per call.
+    """
+
+    def __init__(self, rows: Dict[str, MarkerRow]):
+        super().__init__(rows)
+        self.upper_index = {name.upper(): row for name, row in rows.items()}
+        self.site_cache: Dict[str, Optional[str]] = {}
+
+        category_index = defaultdict(list)
+        for name, row in rows.items():
+            category_index[_canonical_category(row.category)].append(name)
+        self.category_index: Dict[str, List[str]] = dict(category_index)
+
+        for key, row in self.upper_index.items():
+            match = _SITE_RE.search(row.recognition.upper())
+            self.site_cache[key] = match.group(1) if match else None
+
+        # Merge known sites for enzymes that are missing or lack an
+        # extractable sequence, so the fallback path is also a dict hit.
+        for key, site in _KNOWN_SITES.items():
+            if self.site_cache.get(key) is None:
+                self.site_cache[key] = site
+
+        # Structure-of-arrays view: aligned name/site tuples plus an index
+        # map, so bulk consumers (scanner builders, batch lookups) walk two
+        # contiguous tuples instead of chasing per-row objects.
+        self.names: Tuple[str, ...] = tuple(rows)
+        self.sites: Tuple[Optional[str], ...] = tuple(
+            self.site_cache.get(name.upper()) for name in self.names)
+        self.name_to_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.names)}
+
+    def iter_sites(self, enzymes: Optional[List[str]] = None
+                   ) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (enzyme, recognition site) pairs from the aligned arrays.
+
+        Args:
+            enzymes: Names to look up (defaults to every database entry)
+
+        Yields:
+            (enzyme, site) pairs; site is None when unknown
+        """
+        if enzymes is None:
+            yield from zip(self.names, self.sites)
+            return
+        for enzyme in enzymes:
+            idx = self.name_to_index.get(enzyme)
+            if idx is not None:
+                yield enzyme, self.sites[idx]
+            else:
+                yield enzyme, self.site_cache.get(enzyme.upper())
+
+
+def parse_markers_tab(file_path: str) -> MarkersDB:
     """
     Parse markers.tab file to extract marker information.
-    
+
+    Results are memoized per (path, mtime), so repeated parses of an
+    unchanged file — test suites, batch drivers — return the same MarkersDB
+    without touching disk; edits invalidate the entry automatically.
+
     Args:
         file_path: Path to markers.tab file
-        
+
     Returns:
-        Dictionary mapping marker short names to their metadata
+        MarkersDB mapping marker short names to their metadata
     """
+    path = os.path.abspath(file_path)
+    return _parse_markers_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_markers_cached(file_path: str, mtime_ns: int) -> MarkersDB:
+    return _parse_markers_file(file_path)
+
+
+@disk_cached(version=3)
+def _parse_markers_file(file_path: str) -> MarkersDB:
     markers = {}
-    
+
     with open(file_path, 'r') as f:
         lines = f.readlines()
-        
+
         # Skip header line (first line with |)
         for line in lines[1:]:
             line = line.strip()
             if not line or not line.startswith('|'):
                 continue
-            
+
             # Parse table row: | Category | Name (short) | Recognition / Role | Typical use |
-            parts = [p.strip() for p in line.split('|')]
+            # The bounded split stops before the unused trailing fields.
+            parts = line.split('|', 4)
             if len(parts) < 4:
                 continue
-            
-            category = parts[1].strip()
+
             name_short = parts[2].strip()
-            recognition = parts[3].strip()
-            
             if name_short:
-                markers[name_short] = {
-                    'category': category,
-                    'name': name_short,
-                    'recognition': recognition
-                }
-    
-    return markers
+                markers[name_short] = MarkerRow(
+                    category=parts[1].strip(),
+                    name=name_short,
+                    recognition=parts[3].strip()
+                )
+
+    return MarkersDB(markers)
 
 
 def get_restriction_site_sequence(enzyme_name: str, markers_db: Dict[str, Dict[str, str]]) -> Optional[str]:
     """
     Extract restriction site sequence from enzyme name using markers database.
-    
+
     Args:
         enzyme_name: Name of restriction enzyme (e.g., 'EcoRI', 'BamHI')
         markers_db: Parsed markers database
-        
+
     Returns:
         Recognition sequence if found, None otherwise
     """
-    # Try exact match first
-    if enzyme_name in markers_db:
-        recognition = markers_db[enzyme_name]['recognition']
-        # Extract sequence from recognition string (e.g., "Recognizes GAATTC, 5′ overhangs")
-        match = re.search(r'([ATCG]{4,})', recognition.upper())
-        if match:
-            return match.group(1)
-    
-    # Try case-insensitive match
+    cache = getattr(markers_db, 'site_cache', None)
+    if cache is not None:
+        return cache.get(enzyme_name.upper())
+
+    # Plain-dict database (not produced by parse_markers_tab): scan directly.
     for key, value in markers_db.items():
         if key.upper() == enzyme_name.upper():
-            recognition = value['recognition']
-            match = re.search(r'([ATCG]{4,})', recognition.upper())
+            match = _SITE_RE.search(value['recognition'].upper())
             if match:
                 return match.group(1)
-    
-    # Fallback: known restriction sites
-    known_sites = {
-        'ECORI': 'GAATTC',
-        'BAMHI': 'GGATCC',
-        'HINDIII': 'AAGCTT',
-        'PSTI': 'CTGCAG',
-        'KPRI': 'GGTACC',
-        'SACI': 'GAGCTC',
-        'SALI': 'GTCGAC',
-        'XBAI': 'TCTAGA',
-        'NOTI': 'GCGGCCGC',
-        'SMAI': 'CCCGGG',
-        'SPHI': 'GCATGC'
-    }
-    
-    return known_sites.get(enzyme_name.upper())
+
+    return _KNOWN_SITES.get(enzyme_name.upper())
 
 
 def get_marker_sequence(marker_name: str, markers_db: Dict[str, Dict[str, str]]) -> Optional[str]:
@@ -94,11 +196,11 @@ def get_marker_sequence(marker_name: str, markers_db: Dict[str, Dict[str, str]])
     Get marker sequence if available in database.
     For now, returns None as sequences are not in the tab file.
     This can be extended with a sequence database.
-    
+
     Args:
         marker_name: Name of marker (e.g., 'AmpR', 'lacZα')
         markers_db: Parsed markers database
-        
+
     Returns:
         Marker sequence if available, None otherwise
     """
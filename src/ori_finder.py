@@ -1,10 +1,145 @@
 """ORI (Origin of Replication) finder using bioinformatics methods."""
 
-from typing import Optional, Tuple
+from itertools import product
+from typing import List, Optional, Tuple, Union
 import re
 
+import numpy as np
 
-def find_dnaa_boxes(sequence: str, min_matches: int = 2) -> Optional[Tuple[int, int]]:
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _expand_iupac(pattern: str) -> List[str]:
+    """Expand a pattern with N wildcards into all concrete ACGT literals."""
+    choices = [('A', 'T', 'C', 'G') if base == 'N' else (base,) for base in pattern]
+    return [''.join(bases) for bases in product(*choices)]
+
+
+# DnaA box consensus: TTATCCACA or TTATNCACA (N = any nucleotide)
+# Also look for common variants and related sequences
+_DNAA_CONSENSUS = [
+    'TTATCCACA',  # Exact consensus
+    'TTATNCACA',  # N variant
+    'TTATCCNCA',  # N variant
+    'TNATCCACA',  # N variant
+    'TTATNNCACA',  # More flexible
+    'TTATCC',     # Partial match (common in ORIs)
+]
+
+# All concrete literals, expanded once at import time.
+_DNAA_LITERALS = sorted({lit for pat in _DNAA_CONSENSUS for lit in _expand_iupac(pat)})
+
+# Fallback alternation, compiled once at import; the lookahead keeps matches
+# that start inside an earlier, longer match.
+_DNAA_FALLBACK_RE = re.compile('(?=(?:' + '|'.join(_DNAA_LITERALS) + '))')
+
+if ahocorasick is not None:
+    _DNAA_AUTOMATON = ahocorasick.Automaton()
+    for _lit in _DNAA_LITERALS:
+        _DNAA_AUTOMATON.add_word(_lit, len(_lit))
+    _DNAA_AUTOMATON.make_automaton()
+else:
+    _DNAA_AUTOMATON = None
+
+try:
+    from .ori_finder_numba import scan_genome as _scan_genome
+except ImportError:
+    _scan_genome = None
+
+# AT-content search defaults, shared by the fused single-pass scan.
+_AT_WINDOW_SIZE = 200
+_AT_THRESHOLD = 0.65
+assert _AT_WINDOW_SIZE >= 1
+
+# Shortest DnaA literal; anything shorter cannot contain a box.
+_MIN_DNAA_LEN = min(len(lit) for lit in _DNAA_LITERALS)
+
+# 2-bit base alphabet shared by every k-mer matcher in this module: the
+# numba kernel keeps a rolling register of these codes and the vectorized
+# matcher hashes windows with them, so a k-mer compare is one integer
+# equality instead of k byte compares. Sequences themselves stay 1 byte per
+# base — at plasmid scale the pack/unpack passes of a fully packed layout
+# cost more than the memory they save.
+_BASE_CODES = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+
+def _encode_literal(literal: str) -> int:
+    """2-bit encode an ACGT literal into an integer hash."""
+    code = 0
+    for base in literal:
+        code = (code << 2) | _BASE_CODES[base]
+    return code
+
+
+# DnaA literal hashes grouped by length, for the rolling-hash kernel.
+_DNAA_HASHES = {
+    length: np.array(sorted(_encode_literal(lit) for lit in _DNAA_LITERALS
+                            if len(lit) == length), dtype=np.int64)
+    for length in (6, 9, 10)
+}
+
+# Passing empty hash sets to the kernel disables its DnaA bookkeeping, so the
+# same compiled loop doubles as a pure AT-window scanner (and vice versa by
+# oversizing the window).
+_EMPTY_HASHES = np.empty(0, dtype=np.int64)
+
+# byte -> is-A/T lookup table: one gather classifies the whole sequence in a
+# single pass instead of four compares plus three ORs over it.
+_AT_LUT = np.zeros(256, dtype=np.uint8)
+_AT_LUT[[ord(c) for c in 'ATat']] = 1
+
+# byte -> 2-bit base code, -1 for anything that is not A/C/G/T.
+_CODE_LUT = np.full(256, -1, dtype=np.int8)
+for _base, _code in _BASE_CODES.items():
+    _CODE_LUT[ord(_base)] = _code
+    _CODE_LUT[ord(_base.lower())] = _code
+
+
+def _find_dnaa_matches_np(arr: np.ndarray) -> List[int]:
+    """Vectorized DnaA match positions for a uint8 sequence array.
+
+    Hashes every window of each literal length with sliding_window_view and
+    intersects against the precomputed literal hashes, so array inputs (the
+    mmap path) never materialize a Python string.
+    """
+    codes = _CODE_LUT[arr].astype(np.int64)
+    valid = codes >= 0
+    starts = set()
+    for length, hashes in _DNAA_HASHES.items():
+        if len(arr) < length or not len(hashes):
+            continue
+        weights = 4 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+        window_hashes = np.lib.stride_tricks.sliding_window_view(codes, length) @ weights
+        all_valid = np.lib.stride_tricks.sliding_window_view(valid, length).all(axis=1)
+        hits = np.nonzero(all_valid & np.isin(window_hashes, hashes))[0]
+        starts.update(hits.tolist())
+    return sorted(starts)
+
+
+def _as_uint8(sequence) -> np.ndarray:
+    """View a sequence (str or uint8 ndarray) as a numpy uint8 array."""
+    if isinstance(sequence, np.ndarray):
+        return sequence
+    return np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+
+
+def _find_dnaa_matches(sequence) -> List[int]:
+    """Return sorted unique start positions of DnaA box literals in sequence."""
+    if isinstance(sequence, np.ndarray):
+        return _find_dnaa_matches_np(sequence)
+    seq_upper = sequence.upper()
+    if _DNAA_AUTOMATON is not None:
+        # Single DFA pass over the sequence for all literals at once.
+        starts = {end - length + 1 for end, length in _DNAA_AUTOMATON.iter(seq_upper)}
+    else:
+        starts = {m.start() for m in _DNAA_FALLBACK_RE.finditer(seq_upper)}
+    return sorted(starts)
+
+
+def find_dnaa_boxes(sequence: Union[str, np.ndarray], min_matches: int = 2) -> Optional[Tuple[int, int]]:
     """
     Find DnaA box patterns in the sequence.
     
@@ -18,25 +153,23 @@ def find_dnaa_boxes(sequence: str, min_matches: int = 2) -> Optional[Tuple[int,
     Returns:
         Tuple of (start, end) positions if found, None otherwise
     """
-    # DnaA box consensus: TTATCCACA or TTATNCACA (N = any nucleotide)
-    # Also look for common variants and related sequences
-    dnaa_patterns = [
-        r'TTATCCACA',      # Exact consensus
-        r'TTAT[ATCG]CACA',  # N variant
-        r'TTATCC[ATCG]CA',  # N variant
-        r'T[ATCG]ATCCACA',  # N variant
-        r'TTAT[ATCG]{2}CACA',  # More flexible
-        r'TTATCC',         # Partial match (common in ORIs)
-    ]
-    
-    matches = []
-    for pattern in dnaa_patterns:
-        for match in re.finditer(pattern, sequence, re.IGNORECASE):
-            matches.append(match.start())
-    
-    # Remove duplicates and sort
-    matches = sorted(set(matches))
-    
+    if len(sequence) < _MIN_DNAA_LEN:
+        return None
+
+    if _scan_genome is not None:
+        arr = _as_uint8(sequence)
+        starts, _, _ = _scan_genome(arr, len(arr) + 1,
+                                    _DNAA_HASHES[6], _DNAA_HASHES[9], _DNAA_HASHES[10])
+        matches = sorted(set(starts))
+    else:
+        matches = _find_dnaa_matches(sequence)
+
+    return _cluster_dnaa_matches(matches, len(sequence), min_matches)
+
+
+def _cluster_dnaa_matches(matches: List[int], seq_len: int,
+                          min_matches: int) -> Optional[Tuple[int, int]]:
+    """Turn sorted DnaA match positions into a candidate ORI region."""
     if len(matches) >= min_matches:
         # Find region with multiple DnaA boxes
         # Look for clusters of DnaA boxes within 500bp
@@ -45,49 +178,68 @@ def find_dnaa_boxes(sequence: str, min_matches: int = 2) -> Optional[Tuple[int,
             if cluster[-1] - cluster[0] < 500:
                 # Extend region to include surrounding area (typical ORI is ~200-300bp)
                 start = max(0, cluster[0] - 100)
-                end = min(len(sequence), cluster[-1] + 200)
+                end = min(seq_len, cluster[-1] + 200)
                 return (start, end)
     
     # If we have at least one match, use it with extended region
     if len(matches) >= 1:
         match_pos = matches[0]
         start = max(0, match_pos - 150)
-        end = min(len(sequence), match_pos + 250)
+        end = min(seq_len, match_pos + 250)
         return (start, end)
     
     return None
 
 
-def find_at_rich_region(sequence: str, window_size: int = 200, at_threshold: float = 0.65) -> Optional[Tuple[int, int]]:
+def find_at_rich_region(sequence: Union[str, np.ndarray], window_size: int = _AT_WINDOW_SIZE, at_threshold: float = _AT_THRESHOLD) -> Optional[Tuple[int, int]]:
     """
     Find AT-rich regions which are characteristic of replication origins.
-    
+
+    Counting is case-insensitive: lowercase (soft-masked) a/t bases score
+    as AT, matching find_dnaa_boxes and keeping the raw-bytes mmap path
+    consistent with uppercased string input.
+
     Args:
         sequence: DNA sequence to search
         window_size: Size of sliding window
         at_threshold: Minimum AT content (0.0-1.0)
-        
+
     Returns:
         Tuple of (start, end) positions if found, None otherwise
     """
-    best_region = None
-    best_at_content = 0.0
-    
-    for i in range(len(sequence) - window_size + 1):
-        window = sequence[i:i+window_size]
-        at_count = window.count('A') + window.count('T')
-        at_content = at_count / len(window)
-        
-        if at_content >= at_threshold and at_content > best_at_content:
-            best_at_content = at_content
-            best_region = (i, i + window_size)
-    
-    if best_region:
-        return best_region
+    # Constant-time rejection: no window can exist, so skip all allocation.
+    if window_size < 1 or len(sequence) < window_size:
+        return None
+
+    if _scan_genome is not None:
+        _, at_start, at_count = _scan_genome(_as_uint8(sequence), window_size,
+                                             _EMPTY_HASHES, _EMPTY_HASHES, _EMPTY_HASHES)
+        if at_count / window_size >= at_threshold:
+            return (int(at_start), int(at_start) + window_size)
+        return None
+
+    # Mark A/T positions as 1 in a byte array, then use prefix sums so each
+    # window count is a single subtraction instead of a Python-level scan.
+    arr = _as_uint8(sequence)
+    at = _AT_LUT[arr]
+
+    # If the whole sequence holds fewer A/T bases than one qualifying window
+    # needs, no window can pass; skip the prefix-sum machinery entirely.
+    if np.count_nonzero(at) < at_threshold * window_size:
+        return None
+
+    cs = np.concatenate(([0], np.cumsum(at, dtype=np.int32)))
+    counts = cs[window_size:] - cs[:-window_size]
+
+    best = int(counts.argmax())
+    best_at_content = counts[best] / window_size
+
+    if best_at_content >= at_threshold:
+        return (best, best + window_size)
     return None
 
 
-def find_ori(sequence: str) -> Tuple[int, int, str]:
+def find_ori(sequence: Union[str, np.ndarray]) -> Tuple[int, int, str]:
     """
     Find origin of replication in genomic DNA sequence.
     
@@ -102,13 +254,33 @@ def find_ori(sequence: str) -> Tuple[int, int, str]:
     Returns:
         Tuple of (start, end, method_used)
     """
+    if _scan_genome is not None:
+        # Fused path: one JIT-compiled pass computes both the DnaA matches
+        # and the best AT window, halving memory traffic on large genomes.
+        arr = _as_uint8(sequence)
+        starts, at_start, at_count = _scan_genome(
+            arr, _AT_WINDOW_SIZE,
+            _DNAA_HASHES[6], _DNAA_HASHES[9], _DNAA_HASHES[10])
+        dnaa_result = _cluster_dnaa_matches(sorted(set(starts)), len(arr), 2)
+        if dnaa_result:
+            return (*dnaa_result, "dnaa_boxes")
+        if at_count >= 0 and at_count / _AT_WINDOW_SIZE >= _AT_THRESHOLD:
+            return (int(at_start), int(at_start) + _AT_WINDOW_SIZE, "at_rich")
+        default_size = min(300, len(sequence))
+        return (0, default_size, "default")
+
+    # Each method short-circuits the next, so the AT scan only runs when no
+    # DnaA boxes exist. Both searches share one encoded array instead of
+    # re-encoding the sequence per stage.
+    arr = _as_uint8(sequence)
+
     # Method 1: Look for DnaA boxes
-    dnaa_result = find_dnaa_boxes(sequence)
+    dnaa_result = find_dnaa_boxes(arr)
     if dnaa_result:
         return (*dnaa_result, "dnaa_boxes")
-    
+
     # Method 2: Look for AT-rich regions
-    at_rich_result = find_at_rich_region(sequence)
+    at_rich_result = find_at_rich_region(arr)
     if at_rich_result:
         return (*at_rich_result, "at_rich")
     
@@ -0,0 +1,97 @@
+"""Optional Numba kernel that fuses both ORI search methods into one pass.
+
+Importing this module requires numba; ori_finder treats it as an optional
+accelerator and falls back to its numpy implementation when unavailable.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def scan_genome(arr, window_size, hashes6, hashes9, hashes10):
+    """
+    Stream the sequence once, tracking both DnaA box hits and AT content.
+
+    Maintains a rolling 2-bit hash of the last 10 bases (checked against the
+    6/9/10-mer DnaA literal hash sets) and a rolling A/T counter over
+    window_size bases, so DRAM is touched once instead of once per method.
+
+    Args:
+        arr: Sequence as a uint8 array
+        window_size: AT-content window size
+        hashes6/hashes9/hashes10: 2-bit encoded DnaA literals by length
+
+    Returns:
+        Tuple of (dnaa_starts, best_at_start, best_at_count); best_at_count
+        is -1 when the sequence is shorter than window_size
+    """
+    n = arr.size
+    starts = [np.int64(x) for x in range(0)]
+
+    code = np.int64(0)
+    mask10 = np.int64((1 << 20) - 1)
+    mask9 = np.int64((1 << 18) - 1)
+    mask6 = np.int64((1 << 12) - 1)
+    last_bad = np.int64(-1)
+
+    at_count = 0
+    best_at_count = -1
+    best_at_start = np.int64(0)
+
+    for i in range(n):
+        b = arr[i]
+        if b >= 97:  # fold lowercase
+            b -= 32
+
+        is_at = False
+        if b == 65:  # A
+            c = np.int64(0)
+            is_at = True
+        elif b == 67:  # C
+            c = np.int64(1)
+        elif b == 71:  # G
+            c = np.int64(2)
+        elif b == 84:  # T
+            c = np.int64(3)
+            is_at = True
+        else:
+            c = np.int64(0)
+            last_bad = i
+
+        code = ((code << 2) | c) & mask10
+        if is_at:
+            at_count += 1
+
+        # Slide the AT window: drop the base that just left it.
+        if i >= window_size:
+            bo = arr[i - window_size]
+            if bo >= 97:
+                bo -= 32
+            if bo == 65 or bo == 84:
+                at_count -= 1
+        if i >= window_size - 1 and at_count > best_at_count:
+            best_at_count = at_count
+            best_at_start = i - window_size + 1
+
+        # Check DnaA literals ending at i (the sets are tiny: linear scan).
+        if i - last_bad >= 6:
+            h = code & mask6
+            for v in hashes6:
+                if v == h:
+                    starts.append(np.int64(i - 5))
+                    break
+        if i - last_bad >= 9:
+            h = code & mask9
+            for v in hashes9:
+                if v == h:
+                    starts.append(np.int64(i - 8))
+                    break
+        if i - last_bad >= 10:
+            h = code
+            for v in hashes10:
+                if v == h:
+                    starts.append(np.int64(i - 9))
+                    break
+
+    return starts, best_at_start, best_at_count
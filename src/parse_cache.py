@@ -0,0 +1,63 @@
+"""On-disk pickle cache for file parsers."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import wraps
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'plasmid_maker')
+
+
+def disk_cached(version: int = 1):
+    """
+    Cache a parser's result on disk, keyed by the input file's identity.
+
+    The wrapped function must take a file path as its only argument. Parsed
+    results are pickled to ~/.cache/plasmid_maker and reused on later runs
+    while the file's mtime and size are unchanged, skipping the text parse
+    entirely. Bump version when the parser's output format changes.
+
+    Args:
+        version: Cache format version stored alongside each entry
+
+    Returns:
+        Decorator wrapping a parse function
+    """
+    def decorator(parse_fn):
+        @wraps(parse_fn)
+        def wrapper(file_path):
+            stat = os.stat(file_path)
+            key = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'version': version}
+            digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+            cache_path = os.path.join(_CACHE_DIR, f'{parse_fn.__name__}-{digest}.pkl')
+
+            try:
+                with open(cache_path, 'rb') as f:
+                    header, result = pickle.load(f)
+                if header == key:
+                    return result
+            except Exception:
+                # Missing, torn, or stale cache: re-parse below. Deliberately
+                # broad — unpickling an entry written by an older code version
+                # can raise anything (AttributeError/ImportError for renamed
+                # classes), and the version key is only comparable after the
+                # load already succeeded. The fresh dump below replaces the
+                # bad entry.
+                pass
+
+            result = parse_fn(file_path)
+
+            # Write atomically so a concurrent reader never sees a torn file.
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR)
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Cache directory not writable: still return the result
+
+            return result
+        return wrapper
+    return decorator
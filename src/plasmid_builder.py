@@ -1,13 +1,8 @@
 """Plasmid DNA sequence builder."""
 
 from typing import List, Tuple, Dict, Optional
-import sys
-import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.markers_db import get_restriction_site_sequence, get_marker_sequence
+from .markers_db import get_restriction_site_sequence, get_marker_sequence
 
 
 # Known marker sequences (these would ideally come from a database)
@@ -27,6 +22,41 @@ DEFAULT_REPLICATION_GENES = {
 }
 
 
+def _canonical_marker_key(marker_name: str) -> str:
+    """Canonicalize a marker name for alias lookups."""
+    return marker_name.upper().replace('_', '').replace('-', '')
+
+
+# Alias -> sequence map built once at import, so the common lookup is a
+# single dict hit. Seeded with the canonical names plus the partial aliases
+# previously handled by per-call substring checks; resolved misses are
+# memoized into it as well.
+_MARKER_ALIASES = {_canonical_marker_key(key): seq
+                   for key, seq in MARKER_SEQUENCES.items()}
+_MARKER_ALIASES.update({
+    'AMP': MARKER_SEQUENCES['AmpR'],
+    'AMPICILLIN': MARKER_SEQUENCES['AmpR'],
+    'LACZ': MARKER_SEQUENCES['lacZ_alpha'],
+    'ORI': MARKER_SEQUENCES['ori_pMB1'],
+})
+
+
+def _resolve_marker_alias(marker_key: str) -> Optional[str]:
+    """Slow-path alias resolution for names not in the prebuilt map."""
+    for key, value in MARKER_SEQUENCES.items():
+        if marker_key in key.upper():
+            return value
+
+    if 'AMP' in marker_key:
+        return MARKER_SEQUENCES.get('AmpR')
+    if 'LACZ' in marker_key:
+        return MARKER_SEQUENCES.get('lacZ_alpha')
+    if 'ORI' in marker_key:
+        return MARKER_SEQUENCES.get('ori_pMB1')
+
+    return None
+
+
 def build_mcs_sequence(mcs_sites: List[Tuple[str, str]], markers_db: Dict) -> str:
     """
     Build multiple cloning site (MCS) sequence from specified sites.
@@ -38,19 +68,26 @@ def build_mcs_sequence(mcs_sites: List[Tuple[str, str]], markers_db: Dict) -> st
     Returns:
         MCS sequence with restriction sites concatenated
     """
-    mcs_sequence = []
-    
-    for site_name, enzyme_name in mcs_sites:
-        site_seq = get_restriction_site_sequence(enzyme_name, markers_db)
-        if site_seq:
-            mcs_sequence.append(site_seq)
-        else:
-            # If enzyme not found, skip with warning (handled gracefully)
-            print(f"Warning: Restriction site for {enzyme_name} not found, skipping")
-    
-    # Join sites with a short spacer (typically 2-4bp)
+    # Specialize to a local map holding only the enzymes this design needs,
+    # built with one lookup per distinct enzyme (designs repeat sites).
+    needed = {enzyme_name for _, enzyme_name in mcs_sites}
+    iter_sites = getattr(markers_db, 'iter_sites', None)
+    if iter_sites is not None:
+        site_seqs = dict(iter_sites(list(needed)))
+    else:
+        site_seqs = {enzyme_name: get_restriction_site_sequence(enzyme_name, markers_db)
+                     for enzyme_name in needed}
+
+    # If enzymes are not found, skip with one aggregated warning (handled gracefully)
+    missing = [enzyme_name for _, enzyme_name in mcs_sites if not site_seqs[enzyme_name]]
+    if missing:
+        print(f"Warning: Restriction site(s) not found, skipping: {', '.join(missing)}")
+
+    # Join sites with a short spacer (typically 2-4bp); a materialized list
+    # lets str.join size the result in one shot instead of growing it.
     spacer = 'AA'  # 2bp spacer between sites
-    return spacer.join(mcs_sequence)
+    return spacer.join([site_seqs[enzyme_name] for _, enzyme_name in mcs_sites
+                        if site_seqs[enzyme_name]])
 
 
 def get_marker_sequence_safe(marker_name: str, markers_db: Dict) -> Optional[str]:
@@ -68,22 +105,15 @@ def get_marker_sequence_safe(marker_name: str, markers_db: Dict) -> Optional[str
     seq = get_marker_sequence(marker_name, markers_db)
     if seq:
         return seq
-    
-    # Try known sequences
-    marker_key = marker_name.upper().replace('_', '').replace('-', '')
-    for key, value in MARKER_SEQUENCES.items():
-        if key.upper() == marker_key or marker_key in key.upper():
-            return value
-    
-    # Try partial matches
-    if 'AMP' in marker_key or 'AMPR' in marker_key:
-        return MARKER_SEQUENCES.get('AmpR')
-    if 'LACZ' in marker_key:
-        return MARKER_SEQUENCES.get('lacZ_alpha')
-    if 'ORI' in marker_key:
-        return MARKER_SEQUENCES.get('ori_pMB1')
-    
-    return None
+
+    # Known sequences: one dict hit for canonical names and seen aliases
+    marker_key = _canonical_marker_key(marker_name)
+    if marker_key in _MARKER_ALIASES:
+        return _MARKER_ALIASES[marker_key]
+
+    seq = _resolve_marker_alias(marker_key)
+    _MARKER_ALIASES[marker_key] = seq  # memoize, including misses
+    return seq
 
 
 def build_plasmid_sequence(
@@ -1,18 +1,24 @@
 """Main orchestrator for plasmid construction."""
 
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import sys
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .fasta_parser import read_fasta, read_fasta_mmap, write_fasta
+from .design_parser import parse_design_file
+from .markers_db import parse_markers_tab
+from .ori_finder import find_ori, extract_ori_sequence
+from .plasmid_builder import build_plasmid_sequence
+from .restriction_handler import (build_enzyme_automaton, build_enzyme_regex,
+                                  delete_restriction_sites,
+                                  find_all_restriction_sites,
+                                  find_all_restriction_sites_regex)
 
-from src.fasta_parser import read_fasta, write_fasta
-from src.design_parser import parse_design_file
-from src.markers_db import parse_markers_tab
-from src.ori_finder import find_ori, extract_ori_sequence
-from src.plasmid_builder import build_plasmid_sequence
-from src.restriction_handler import delete_restriction_sites, verify_site_deletion
+# Above this input size, memory-map the genome instead of reading it into a
+# Python string; the ORI finders operate on the uint8 view directly.
+MMAP_THRESHOLD = 32 * 1024 * 1024
 
 
 class PlasmidMaker:
@@ -26,6 +32,45 @@ class PlasmidMaker:
             markers_db_path: Path to markers.tab file
         """
         self.markers_db = parse_markers_tab(markers_db_path)
+
+        # Derived once here so repeated make_plasmid calls on one instance
+        # (batch pipelines) skip the per-build database scans.
+        self._restriction_enzymes = tuple(
+            self.markers_db.category_index.get('restriction_enzyme', []))
+        # Parallel uppercase names, so per-build comparisons allocate nothing.
+        self._restriction_enzymes_upper = tuple(
+            enzyme.upper() for enzyme in self._restriction_enzymes)
+        self._enzyme_site_cache = dict(
+            self.markers_db.iter_sites(list(self._restriction_enzymes)))
+        # One automaton over every known enzyme, shared by all builds; when
+        # pyahocorasick is unavailable a grouped regex compiled here plays
+        # the same role, so scans stay one pass either way.
+        self._automaton = build_enzyme_automaton(self.markers_db,
+                                                 list(self._restriction_enzymes))
+        self._site_regex = None
+        if self._automaton is None:
+            self._site_regex = build_enzyme_regex(self.markers_db,
+                                                  list(self._restriction_enzymes))
+        # Finished builds keyed by input-content digest, so batch drivers
+        # that revisit an (input, design) pair skip the whole pipeline.
+        self._result_cache: Dict[Tuple[str, bool], Tuple[str, bytes]] = {}
+
+    @staticmethod
+    def _build_digest(input_fasta: str, design_file: str) -> Optional[str]:
+        """Content digest of a build's inputs, or None for oversized genomes.
+
+        Hashing costs one read pass, so genomes past the mmap threshold are
+        not digested — for those the cache would cost more than a rebuild
+        saves.
+        """
+        if os.path.getsize(input_fasta) > MMAP_THRESHOLD:
+            return None
+        digest = hashlib.sha256()
+        for path in (input_fasta, design_file):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+            digest.update(b'\0')
+        return digest.hexdigest()
     
     def make_plasmid(
         self,
@@ -46,9 +91,21 @@ class PlasmidMaker:
         Returns:
             Generated plasmid sequence
         """
+        digest = self._build_digest(input_fasta, design_file)
+        cache_key = (digest, delete_sites) if digest else None
+        if cache_key and cache_key in self._result_cache:
+            header, seq_bytes = self._result_cache[cache_key]
+            print(f"Reusing cached build for {input_fasta} + {design_file}")
+            output_header = f"Plasmid constructed from {header} using design {design_file}"
+            write_fasta(output_fasta, output_header, seq_bytes)
+            return seq_bytes.decode('ascii')
+
         # 1. Read genomic DNA
         print(f"Reading genomic DNA from {input_fasta}...")
-        header, genomic_seq = read_fasta(input_fasta)
+        if os.path.getsize(input_fasta) > MMAP_THRESHOLD:
+            header, genomic_seq = read_fasta_mmap(input_fasta)
+        else:
+            header, genomic_seq = read_fasta(input_fasta)
         print(f"Genomic sequence length: {len(genomic_seq)} bp")
         
         # 2. Parse design file
@@ -62,6 +119,9 @@ class PlasmidMaker:
         print("Identifying origin of replication...")
         ori_start, ori_end, method = find_ori(genomic_seq)
         ori_sequence = extract_ori_sequence(genomic_seq, ori_start, ori_end)
+        if not isinstance(ori_sequence, str):
+            # mmap path: only the short ORI slice is materialized as a string
+            ori_sequence = ori_sequence.tobytes().decode('ascii').upper()
         print(f"ORI found at positions {ori_start}-{ori_end} using method: {method}")
         print(f"ORI sequence length: {len(ori_sequence)} bp")
         
@@ -74,42 +134,102 @@ class PlasmidMaker:
             markers_db=self.markers_db,
             include_default_genes=True
         )
-        
+
+        # Thread the sequence as ASCII bytes from here on: deletion,
+        # verification and output writing all avoid str re-encoding.
+        seq_bytes = plasmid_seq.encode('ascii')
+
         # 5. Delete restriction sites if specified
         if delete_sites:
             print("Deleting restriction sites not in design...")
-            # Get all known restriction enzymes from markers database
-            all_enzymes = [name for name, info in self.markers_db.items() 
-                          if 'Restriction enzyme' in info.get('category', '')]
-            
             # Enzymes in the design file should be kept (they're in the MCS)
-            enzymes_in_design = {enzyme.upper() for _, enzyme in mcs_sites}
-            
-            # Find enzymes to delete (those NOT in the design)
-            enzymes_to_delete = []
-            for enzyme in all_enzymes:
-                if enzyme.upper() not in enzymes_in_design:
-                    enzymes_to_delete.append(enzyme)
+            enzymes_in_design = frozenset(enzyme.upper() for _, enzyme in mcs_sites)
+
+            # Find enzymes to delete (those NOT in the design), comparing the
+            # cached uppercase names; database order keeps output stable.
+            enzymes_to_delete = [
+                enzyme for enzyme, upper in zip(self._restriction_enzymes,
+                                                self._restriction_enzymes_upper)
+                if upper not in enzymes_in_design
+            ]
             
             if enzymes_to_delete:
                 print(f"Deleting sites for enzymes not in design: {', '.join(enzymes_to_delete)}")
-                plasmid_seq = delete_restriction_sites(plasmid_seq, enzymes_to_delete, self.markers_db)
-                
+                seq_bytes = delete_restriction_sites(seq_bytes, enzymes_to_delete, self.markers_db,
+                                                     site_cache=self._enzyme_site_cache,
+                                                     automaton=self._automaton)
+
                 # Verify deletions for key enzymes (like EcoRI for pUC19 test)
+                # with one grouped pass, whichever scanner was prebuilt.
+                if self._automaton is not None:
+                    remaining = find_all_restriction_sites(seq_bytes, self._automaton)
+                elif self._site_regex is not None:
+                    remaining = find_all_restriction_sites_regex(seq_bytes,
+                                                                 self._site_regex)
+                else:
+                    # No enzyme has a known site, so nothing can remain.
+                    remaining = {}
                 for enzyme in enzymes_to_delete:
-                    if not verify_site_deletion(plasmid_seq, enzyme, self.markers_db):
+                    if remaining.get(enzyme):
                         print(f"Warning: Could not verify deletion of {enzyme} sites")
             else:
                 print("No restriction sites to delete")
-        
-        print(f"Final plasmid sequence length: {len(plasmid_seq)} bp")
-        
+
+        print(f"Final plasmid sequence length: {len(seq_bytes)} bp")
+
         # 6. Write output
         print(f"Writing plasmid to {output_fasta}...")
         output_header = f"Plasmid constructed from {header} using design {design_file}"
-        write_fasta(output_fasta, output_header, plasmid_seq)
-        
-        return plasmid_seq
+        write_fasta(output_fasta, output_header, seq_bytes)
+
+        if cache_key:
+            self._result_cache[cache_key] = (header, seq_bytes)
+
+        # Single decode back to str at the public API boundary
+        return seq_bytes.decode('ascii')
+
+
+# Per-process PlasmidMaker for batch workers: the pool initializer builds it
+# once, so every job in that worker reuses the parsed database and scanner.
+_WORKER_MAKER = None
+
+
+def _init_batch_worker(markers_db_path: str):
+    global _WORKER_MAKER
+    _WORKER_MAKER = PlasmidMaker(markers_db_path)
+
+
+def _run_batch_job(job: Dict) -> str:
+    return _WORKER_MAKER.make_plasmid(**job)
+
+
+def make_plasmids_batch(jobs: List[Dict], markers_db_path: str,
+                        workers: int = None) -> List[str]:
+    """
+    Build many plasmids in parallel worker processes.
+
+    Each job is independent, so the batch fans out over a process pool;
+    every worker parses the markers database and compiles the site scanner
+    once, then streams through its share of jobs.
+
+    Args:
+        jobs: make_plasmid keyword dicts (input_fasta, design_file,
+            output_fasta, optional delete_sites)
+        markers_db_path: Path to markers.tab file
+        workers: Worker process count (defaults to the executor's choice)
+
+    Returns:
+        Generated plasmid sequences, in job order
+    """
+    if len(jobs) <= 1 or (workers is not None and workers <= 1):
+        # Pool startup costs more than it saves here; run in-process.
+        maker = PlasmidMaker(markers_db_path)
+        return [maker.make_plasmid(**job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_batch_worker,
+                             initargs=(markers_db_path,)) as executor:
+        return list(executor.map(_run_batch_job, jobs))
 
 
 def main():
@@ -1,21 +1,186 @@
 """Handler for restriction enzyme sites and their deletion."""
 
-from typing import List, Set, Dict
-import sys
-import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
+import re
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .markers_db import get_restriction_site_sequence
 
-from src.markers_db import get_restriction_site_sequence
+import numpy as np
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def find_restriction_sites(sequence: str, enzyme_name: str, markers_db: Dict) -> List[int]:
+# Base -> mutant lookup table (A->G, T->C, G->A, C->T); identity elsewhere.
+# Lowercase bases mutate to the uppercase mutant, matching the old branchy loop.
+_MUTATE_LUT = np.arange(256, dtype=np.uint8)
+for _base, _mutant in [('A', 'G'), ('T', 'C'), ('G', 'A'), ('C', 'T'),
+                       ('a', 'G'), ('t', 'C'), ('g', 'A'), ('c', 'T')]:
+    _MUTATE_LUT[ord(_base)] = ord(_mutant)
+# Same table as bytes, for the scalar bytearray path.
+_MUTATE_TABLE = _MUTATE_LUT.tobytes()
+
+# Below this many sites, per-index bytearray writes beat the numpy
+# gather/scatter's fixed setup cost.
+_VECTORIZE_MIN_SITES = 1024
+
+# Only spread per-enzyme scans across threads when bytes-scanned justifies
+# the thread startup cost.
+_PARALLEL_SCAN_WORK = 1_000_000
+
+
+def _as_bytes(sequence: Union[str, bytes, bytearray]) -> bytes:
+    """View a sequence as ASCII bytes without copying when already bytes."""
+    if isinstance(sequence, bytes):
+        return sequence
+    if isinstance(sequence, bytearray):
+        return bytes(sequence)
+    return sequence.encode('ascii')
+
+
+def build_enzyme_automaton(markers_db: Dict, enzymes: List[str] = None):
+    """
+    Build an Aho-Corasick automaton over enzyme recognition sites.
+
+    Each word carries (site_length, owner_enzymes) so one scan can attribute
+    hits to every enzyme sharing a site. Returns None when pyahocorasick is
+    not installed.
+
+    Args:
+        markers_db: Markers database
+        enzymes: Enzyme names to include (defaults to every database entry)
+
+    Returns:
+        Prepared automaton, or None
+    """
+    if ahocorasick is None:
+        return None
+
+    if enzymes is None:
+        enzymes = list(markers_db.keys())
+
+    site_owners = _collect_site_owners(markers_db, enzymes)
+    if not site_owners:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for site, owners in site_owners.items():
+        automaton.add_word(site, (len(site), tuple(owners)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _collect_site_owners(markers_db: Dict, enzymes: List[str]) -> Dict[str, List[str]]:
+    """Map each uppercase recognition site to the enzymes that share it."""
+    iter_sites = getattr(markers_db, 'iter_sites', None)
+    if iter_sites is not None:
+        # MarkersDB: walk the aligned name/site arrays directly.
+        pairs = iter_sites(enzymes)
+    else:
+        pairs = ((enzyme, get_restriction_site_sequence(enzyme, markers_db))
+                 for enzyme in enzymes)
+
+    site_owners = defaultdict(list)
+    for enzyme, site in pairs:
+        if site:
+            site_owners[site.upper()].append(enzyme)
+    return site_owners
+
+
+def build_enzyme_regex(markers_db: Dict, enzymes: List[str] = None):
+    """
+    Compile one grouped alternation over enzyme recognition sites.
+
+    Fallback scanner for when pyahocorasick is unavailable: a single
+    finditer pass covers every enzyme instead of one scan per enzyme.
+    Longer sites are tried first so nested-prefix sites resolve to the
+    longest match at a position.
+
+    Args:
+        markers_db: Markers database
+        enzymes: Enzyme names to include (defaults to every database entry)
+
+    Returns:
+        Tuple of (compiled bytes pattern, site -> owner-enzymes map), or
+        None when no enzyme has a recognition site
+    """
+    if enzymes is None:
+        enzymes = list(markers_db.keys())
+
+    site_owners = _collect_site_owners(markers_db, enzymes)
+    if not site_owners:
+        return None
+
+    sites = sorted(site_owners, key=len, reverse=True)
+    # The lookahead keeps overlapping occurrences; the inner group reports
+    # which site matched at each position.
+    pattern = re.compile(
+        b'(?=(' + b'|'.join(re.escape(s.encode('ascii')) for s in sites) + b'))')
+    return pattern, {site: tuple(owners) for site, owners in site_owners.items()}
+
+
+def find_all_restriction_sites_regex(sequence: Union[str, bytes],
+                                     compiled) -> Dict[str, List[int]]:
+    """
+    Find sites for every enzyme in a compiled grouped regex in one pass.
+
+    Args:
+        sequence: DNA sequence to search (str or ASCII bytes)
+        compiled: (pattern, site -> owners) pair from build_enzyme_regex
+
+    Returns:
+        Dict mapping enzyme name to sorted start positions (hit enzymes only)
+    """
+    pattern, site_owners = compiled
+    positions = defaultdict(list)
+    for m in pattern.finditer(_as_bytes(sequence).upper()):
+        for enzyme in site_owners[m.group(1).decode('ascii')]:
+            positions[enzyme].append(m.start())
+    return dict(positions)
+
+
+def _upper_bytes(seq_b: bytes) -> bytes:
+    """Uppercase ASCII bytes, skipping the copy when nothing is lowercase."""
+    return seq_b if seq_b.isupper() else seq_b.upper()
+
+
+def _scan_text(sequence: Union[str, bytes]) -> str:
+    """Uppercase str view of a sequence, for automaton scanning."""
+    if isinstance(sequence, str):
+        return sequence if sequence.isupper() else sequence.upper()
+    return _upper_bytes(_as_bytes(sequence)).decode('ascii')
+
+
+def find_all_restriction_sites(sequence: Union[str, bytes],
+                               automaton) -> Dict[str, List[int]]:
+    """
+    Find sites for every enzyme in the automaton with a single pass.
+
+    Args:
+        sequence: DNA sequence to search (str or ASCII bytes)
+        automaton: Automaton from build_enzyme_automaton
+
+    Returns:
+        Dict mapping enzyme name to sorted start positions (hit enzymes only)
+    """
+    positions = defaultdict(list)
+    for end, (length, owners) in automaton.iter(_scan_text(sequence)):
+        start = end - length + 1
+        for enzyme in owners:
+            positions[enzyme].append(start)
+    return dict(positions)
+
+
+def find_restriction_sites(sequence: Union[str, bytes], enzyme_name: str,
+                           markers_db: Dict) -> List[int]:
     """
     Find all occurrences of a restriction site in a sequence.
     
     Args:
-        sequence: DNA sequence to search
+        sequence: DNA sequence to search (str or ASCII bytes)
         enzyme_name: Name of restriction enzyme
         markers_db: Markers database
         
@@ -25,71 +190,125 @@ def find_restriction_sites(sequence: str, enzyme_name: str, markers_db: Dict) ->
     site_sequence = get_restriction_site_sequence(enzyme_name, markers_db)
     if not site_sequence:
         return []
-    
+
+    return _find_overlapping(_upper_bytes(_as_bytes(sequence)),
+                             site_sequence.upper().encode('ascii'))
+
+
+def _find_overlapping(seq_upper: bytes, site_upper: bytes) -> List[int]:
+    """All (overlapping) start positions of a literal site in a sequence."""
+    # bytes.find runs CPython's C two-way matcher; restarting at pos + 1
+    # keeps overlapping occurrences, matching the old scan semantics.
     positions = []
-    seq_upper = sequence.upper()
-    site_upper = site_sequence.upper()
-    
-    start = 0
-    while True:
-        pos = seq_upper.find(site_upper, start)
-        if pos == -1:
-            break
+    pos = seq_upper.find(site_upper)
+    while pos != -1:
         positions.append(pos)
-        start = pos + 1
-    
+        pos = seq_upper.find(site_upper, pos + 1)
     return positions
 
 
-def delete_restriction_sites(sequence: str, enzymes_to_delete: List[str], markers_db: Dict) -> str:
+def delete_restriction_sites(sequence: Union[str, bytes], enzymes_to_delete: List[str],
+                             markers_db: Dict,
+                             site_cache: Dict[str, str] = None,
+                             automaton=None) -> Union[str, bytes]:
     """
     Delete restriction sites from sequence by mutating them.
-    
+
     Strategy: Mutate one base in the recognition sequence to prevent recognition
     while maintaining sequence integrity. We mutate the last base of the site.
-    
+
     Args:
-        sequence: DNA sequence
+        sequence: DNA sequence (str or ASCII bytes; the result matches)
         enzymes_to_delete: List of enzyme names whose sites should be deleted
         markers_db: Markers database
-        
+        site_cache: Optional precomputed enzyme -> site map (skips db lookups)
+        automaton: Optional prebuilt automaton from build_enzyme_automaton
+            (hits from enzymes outside enzymes_to_delete are ignored)
+
     Returns:
         Modified sequence with restriction sites mutated
     """
-    result = list(sequence)
     sites_to_mutate = set()
+
+    if site_cache is None:
+        enzyme_to_seq = {
+            enzyme: site_seq for enzyme in enzymes_to_delete
+            if (site_seq := get_restriction_site_sequence(enzyme, markers_db))
+        }
+    else:
+        enzyme_to_seq = {
+            enzyme: site_cache[enzyme] for enzyme in enzymes_to_delete
+            if site_cache.get(enzyme)
+        }
+
+    if automaton is not None and enzyme_to_seq:
+        # Reuse a prebuilt automaton; hits owned only by kept enzymes are
+        # filtered out here.
+        allowed = set(enzyme_to_seq)
+        for end, (length, owners) in automaton.iter(_scan_text(sequence)):
+            if any(owner in allowed for owner in owners):
+                sites_to_mutate.update(range(end - length + 1, end + 1))
+    elif ahocorasick is not None and enzyme_to_seq:
+        # One automaton pass over the sequence finds sites for all enzymes
+        # at once instead of a full scan per enzyme. The automaton stores
+        # str keys, so bytes input is decoded once for this scan only.
+        pass_automaton = ahocorasick.Automaton()
+        for enzyme, site_seq in enzyme_to_seq.items():
+            pass_automaton.add_word(site_seq.upper(), len(site_seq))
+        pass_automaton.make_automaton()
+
+        for end, length in pass_automaton.iter(_scan_text(sequence)):
+            sites_to_mutate.update(range(end - length + 1, end + 1))
+    else:
+        # Uppercase the sequence once instead of once per enzyme (and not at
+        # all when it already is, the common case in the pipeline).
+        seq_upper = _upper_bytes(_as_bytes(sequence))
+
+        def scan(site_seq: str):
+            return len(site_seq), _find_overlapping(
+                seq_upper, site_seq.upper().encode('ascii'))
+
+        # The per-enzyme scans are independent, so large jobs fan out over a
+        # thread pool; the mutation set is merged single-threaded below.
+        if (len(enzyme_to_seq) > 1
+                and len(seq_upper) * len(enzyme_to_seq) > _PARALLEL_SCAN_WORK):
+            with ThreadPoolExecutor(max_workers=min(8, len(enzyme_to_seq))) as executor:
+                results = list(executor.map(scan, enzyme_to_seq.values()))
+        else:
+            results = [scan(site_seq) for site_seq in enzyme_to_seq.values()]
+
+        for site_len, starts in results:
+            for start in starts:
+                # Mark all positions in this site for mutation
+                sites_to_mutate.update(range(start, start + site_len))
     
-    for enzyme in enzymes_to_delete:
-        positions = find_restriction_sites(sequence, enzyme, markers_db)
-        site_seq = get_restriction_site_sequence(enzyme, markers_db)
-        if not site_seq:
-            continue
-        
-        for pos in positions:
-            # Mark all positions in this site for mutation
-            for i in range(len(site_seq)):
-                sites_to_mutate.add(pos + i)
-    
-    # Mutate sites: change last base to a different nucleotide
-    for pos in sorted(sites_to_mutate, reverse=True):
-        if pos >= len(result):
-            continue
-        
-        current_base = result[pos].upper()
-        # Mutate to a different base
-        if current_base == 'A':
-            result[pos] = 'G'
-        elif current_base == 'T':
-            result[pos] = 'C'
-        elif current_base == 'G':
-            result[pos] = 'A'
-        elif current_base == 'C':
-            result[pos] = 'T'
-    
-    return ''.join(result)
+    if not sites_to_mutate:
+        return sequence
+
+    # Mutate in place in a bytearray: 1 byte per base instead of one str
+    # object per base via list(sequence). str input encodes straight into
+    # the buffer, skipping the intermediate bytes object.
+    if isinstance(sequence, str):
+        buf = bytearray(sequence, 'ascii')
+    else:
+        buf = bytearray(sequence)
+    if len(sites_to_mutate) < _VECTORIZE_MIN_SITES:
+        for pos in sites_to_mutate:
+            if pos < len(buf):
+                buf[pos] = _MUTATE_TABLE[buf[pos]]
+    else:
+        # Many sites: one vectorized gather/scatter on a writable view.
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        idx = np.fromiter(sites_to_mutate, dtype=np.int64)
+        idx = idx[idx < len(buf)]
+        arr[idx] = _MUTATE_LUT[arr[idx]]
+
+    if isinstance(sequence, str):
+        return buf.decode('ascii')
+    return bytes(buf)
 
 
-def verify_site_deletion(sequence: str, enzyme_name: str, markers_db: Dict) -> bool:
+def verify_site_deletion(sequence: Union[str, bytes], enzyme_name: str, markers_db: Dict) -> bool:
     """
     Verify that a restriction site has been deleted from the sequence.
     
@@ -10,13 +10,15 @@ import shutil
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.fasta_parser import read_fasta, write_fasta
+from src.fasta_parser import read_fasta, read_fasta_mmap, write_fasta
 from src.design_parser import parse_design_file
 from src.markers_db import parse_markers_tab, get_restriction_site_sequence
 from src.ori_finder import find_ori, find_dnaa_boxes, find_at_rich_region
 from src.plasmid_builder import build_plasmid_sequence, build_mcs_sequence
-from src.restriction_handler import find_restriction_sites, delete_restriction_sites, verify_site_deletion
-from src.plasmid_maker import PlasmidMaker
+from src.restriction_handler import (build_enzyme_automaton, delete_restriction_sites,
+                                     find_all_restriction_sites, find_restriction_sites,
+                                     verify_site_deletion)
+from src.plasmid_maker import PlasmidMaker, make_plasmids_batch
 
 
 class TestFastaParser(unittest.TestCase):
@@ -32,6 +34,16 @@ class TestFastaParser(unittest.TestCase):
         self.assertTrue(len(sequence) > 0)
         self.assertEqual(sequence, sequence.upper())  # Should be uppercase
     
+    def test_read_fasta_mmap(self):
+        """Test that the mmap reader matches read_fasta on a real file."""
+        test_file = os.path.join(project_root, 'data', 'pUC19.fa')
+        header, sequence = read_fasta(test_file)
+        mmap_header, mmap_arr = read_fasta_mmap(test_file)
+
+        self.assertEqual(mmap_header, header)
+        # The mmap path returns raw bytes without uppercasing
+        self.assertEqual(mmap_arr.tobytes().decode('ascii').upper(), sequence)
+
     def test_write_fasta(self):
         """Test writing a FASTA file."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.fa') as f:
@@ -111,6 +123,13 @@ class TestORIFinder(unittest.TestCase):
         result = find_at_rich_region(sequence)
         self.assertIsNotNone(result)
         self.assertEqual(len(result), 2)
+
+    def test_find_at_rich_region_case_insensitive(self):
+        """Soft-masked (lowercase) a/t bases count toward AT content."""
+        upper = "AT" * 200 + "GC" * 50
+        lower = upper.lower()
+        self.assertEqual(find_at_rich_region(lower), find_at_rich_region(upper))
+        self.assertIsNotNone(find_at_rich_region(lower))
     
     def test_find_ori(self):
         """Test ORI finding with fallback."""
@@ -148,6 +167,22 @@ class TestRestrictionHandler(unittest.TestCase):
         self.assertEqual(len(positions), 1)
         self.assertEqual(positions[0], 4)
     
+    def test_find_all_restriction_sites(self):
+        """The grouped automaton scan matches per-enzyme scans."""
+        markers_file = os.path.join(project_root, 'data', 'markers.tab')
+        markers_db = parse_markers_tab(markers_file)
+
+        automaton = build_enzyme_automaton(markers_db, ['EcoRI', 'BamHI'])
+        if automaton is None:
+            self.skipTest("pyahocorasick not installed")
+
+        sequence = "AAAAGAATTCAAAGGATCCAAAGAATTCAA"
+        grouped = find_all_restriction_sites(sequence, automaton)
+
+        for enzyme in ('EcoRI', 'BamHI'):
+            self.assertEqual(grouped.get(enzyme, []),
+                             find_restriction_sites(sequence, enzyme, markers_db))
+
     def test_delete_restriction_sites(self):
         """Test deleting restriction sites."""
         markers_file = os.path.join(project_root, 'data', 'markers.tab')
@@ -200,96 +235,139 @@ class TestPlasmidBuilder(unittest.TestCase):
 
 class TestPlasmidMakerIntegration(unittest.TestCase):
     """Integration tests for complete plasmid maker."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one PlasmidMaker and temp dir for all integration tests.
+
+        Construction parses markers.tab and compiles the shared site
+        scanner, so it is done once here instead of per test. Scratch
+        files live in one class-scoped directory that tearDownClass
+        removes, so tests cannot leak temp files even on failure.
+        """
+        cls.maker = PlasmidMaker(os.path.join(project_root, 'data', 'markers.tab'))
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmpdir = cls._tmp.name
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
     def test_puc19_test_case(self):
         """Test pUC19 test case - should delete EcoRI sites."""
-        markers_file = os.path.join(project_root, 'data', 'markers.tab')
         input_fasta = os.path.join(project_root, 'data', 'pUC19.fa')
         design_file = os.path.join(project_root, 'data', 'Design_pUC19.txt')
-        
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.fa') as f:
-            output_fasta = f.name
-        
-        try:
-            maker = PlasmidMaker(markers_file)
-            plasmid_seq = maker.make_plasmid(
-                input_fasta=input_fasta,
-                design_file=design_file,
-                output_fasta=output_fasta,
-                delete_sites=True
-            )
-            
-            # Verify output file was created
-            self.assertTrue(os.path.exists(output_fasta))
-            
-            # Verify plasmid sequence was generated
-            self.assertIsInstance(plasmid_seq, str)
-            self.assertTrue(len(plasmid_seq) > 0)
-            
-            # Verify EcoRI sites are deleted (Design_pUC19.txt should delete EcoRI)
-            # Note: The design file lists enzymes, and we delete sites for listed enzymes
-            # However, the design file format might need interpretation
-            # Let's check if EcoRI is in the design and verify deletion
-            design = parse_design_file(design_file)
-            enzymes_in_design = [enzyme for _, enzyme in design['mcs_sites']]
-            
-            # If EcoRI is in the design, verify it's deleted
-            # Actually, looking at Design_pUC19.txt, it doesn't explicitly list EcoRI
-            # But the challenge says it should delete EcoRI. Let me check the original pUC19
-            original_header, original_seq = read_fasta(input_fasta)
-            ecoRI_positions_original = find_restriction_sites(original_seq, 'EcoRI', maker.markers_db)
-            
-            # The challenge states: "This file deletes the EcoRI site"
-            # So we need to verify EcoRI is not in the output
-            ecoRI_positions_output = find_restriction_sites(plasmid_seq, 'EcoRI', maker.markers_db)
-            
-            # EcoRI should be deleted from output
-            # Note: This test might need adjustment based on exact requirements
-            # For now, we verify the process completes successfully
-            
-        finally:
-            if os.path.exists(output_fasta):
-                os.unlink(output_fasta)
-    
+        output_fasta = os.path.join(self.tmpdir, 'puc19_out.fa')
+
+        maker = self.maker
+        plasmid_seq = maker.make_plasmid(
+            input_fasta=input_fasta,
+            design_file=design_file,
+            output_fasta=output_fasta,
+            delete_sites=True
+        )
+
+        # Verify output file was created
+        self.assertTrue(os.path.exists(output_fasta))
+
+        # Verify plasmid sequence was generated
+        self.assertIsInstance(plasmid_seq, str)
+        self.assertTrue(len(plasmid_seq) > 0)
+
+        # Verify EcoRI sites are deleted (Design_pUC19.txt should delete EcoRI)
+        # Note: The design file lists enzymes, and we delete sites for listed enzymes
+        # However, the design file format might need interpretation
+        # Let's check if EcoRI is in the design and verify deletion
+        design = parse_design_file(design_file)
+        enzymes_in_design = [enzyme for _, enzyme in design['mcs_sites']]
+
+        # If EcoRI is in the design, verify it's deleted
+        # Actually, looking at Design_pUC19.txt, it doesn't explicitly list EcoRI
+        # But the challenge says it should delete EcoRI. Let me check the original pUC19
+        original_header, original_seq = read_fasta(input_fasta)
+        ecoRI_positions_original = find_restriction_sites(original_seq, 'EcoRI', maker.markers_db)
+
+        # The challenge states: "This file deletes the EcoRI site"
+        # So we need to verify EcoRI is not in the output
+        ecoRI_positions_output = find_restriction_sites(plasmid_seq, 'EcoRI', maker.markers_db)
+
+        # EcoRI should be deleted from output
+        # Note: This test might need adjustment based on exact requirements
+        # For now, we verify the process completes successfully
+
+    def test_repeated_build_uses_cache_and_writes_output(self):
+        """A repeated build returns identical output and still writes the file."""
+        input_fasta = os.path.join(project_root, 'data', 'pUC19.fa')
+        design_file = os.path.join(project_root, 'data', 'Design_pUC19.txt')
+        first_out = os.path.join(self.tmpdir, 'cache_first.fa')
+        second_out = os.path.join(self.tmpdir, 'cache_second.fa')
+
+        first = self.maker.make_plasmid(
+            input_fasta=input_fasta,
+            design_file=design_file,
+            output_fasta=first_out,
+        )
+        # Second call hits the content-digest cache but must behave the same
+        second = self.maker.make_plasmid(
+            input_fasta=input_fasta,
+            design_file=design_file,
+            output_fasta=second_out,
+        )
+
+        self.assertEqual(second, first)
+        self.assertTrue(os.path.exists(second_out))
+        with open(first_out) as f1, open(second_out) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_make_plasmids_batch(self):
+        """Batch builds in worker processes match a sequential build."""
+        input_fasta = os.path.join(project_root, 'data', 'pUC19.fa')
+        design_file = os.path.join(project_root, 'data', 'Design_pUC19.txt')
+        markers_file = os.path.join(project_root, 'data', 'markers.tab')
+
+        jobs = [
+            {'input_fasta': input_fasta, 'design_file': design_file,
+             'output_fasta': os.path.join(self.tmpdir, f'batch_{i}.fa')}
+            for i in range(2)
+        ]
+        sequences = make_plasmids_batch(jobs, markers_file, workers=2)
+
+        reference = self.maker.make_plasmid(
+            input_fasta=input_fasta,
+            design_file=design_file,
+            output_fasta=os.path.join(self.tmpdir, 'batch_ref.fa'),
+        )
+        self.assertEqual(sequences, [reference] * 2)
+        for job in jobs:
+            self.assertTrue(os.path.exists(job['output_fasta']))
+
     def test_missing_marker_handling(self):
         """Test graceful handling of missing markers."""
-        markers_file = os.path.join(project_root, 'data', 'markers.tab')
-        
         # Create a test design file with a non-existent marker
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        design_file = os.path.join(self.tmpdir, 'missing_marker_design.txt')
+        with open(design_file, 'w') as f:
             f.write("BamHI_site, BamHI\n")
             f.write("NonExistentMarker, Unknown\n")
-            design_file = f.name
-        
+
         # Create a test input FASTA
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.fa') as f:
+        input_fasta = os.path.join(self.tmpdir, 'missing_marker_input.fa')
+        with open(input_fasta, 'w') as f:
             f.write(">test\n")
             f.write("ATCG" * 100 + "TTATCCACA" * 5 + "ATCG" * 100)
-            input_fasta = f.name
-        
-        # Create output file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.fa') as f:
-            output_fasta = f.name
-        
-        try:
-            maker = PlasmidMaker(markers_file)
-            # Should not raise an error, but handle missing marker gracefully
-            plasmid_seq = maker.make_plasmid(
-                input_fasta=input_fasta,
-                design_file=design_file,
-                output_fasta=output_fasta,
-                delete_sites=False
-            )
-            
-            # Should still produce a valid sequence
-            self.assertIsInstance(plasmid_seq, str)
-            self.assertTrue(len(plasmid_seq) > 0)
-            
-        finally:
-            for f in [design_file, input_fasta, output_fasta]:
-                if os.path.exists(f):
-                    os.unlink(f)
+
+        output_fasta = os.path.join(self.tmpdir, 'missing_marker_out.fa')
+
+        # Should not raise an error, but handle missing marker gracefully
+        plasmid_seq = self.maker.make_plasmid(
+            input_fasta=input_fasta,
+            design_file=design_file,
+            output_fasta=output_fasta,
+            delete_sites=False
+        )
+
+        # Should still produce a valid sequence
+        self.assertIsInstance(plasmid_seq, str)
+        self.assertTrue(len(plasmid_seq) > 0)
 
 
 if __name__ == '__main__':